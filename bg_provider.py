@@ -4,7 +4,6 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
-import httpx
 try:
     from astrbot.api import logger  # type: ignore
 except Exception:  # pragma: no cover - fallback for local test env
@@ -29,6 +28,8 @@ async def fetch_loli() -> Optional[BgBytesData]:
     API: https://www.loliapi.com/acg/pe/
     Returns None on error.
     """
+    import httpx
+
     url = "https://www.loliapi.com/acg/pe/"
     try:
         async with httpx.AsyncClient(follow_redirects=True, timeout=10) as cli:
@@ -3,12 +3,11 @@ from __future__ import annotations
 import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-import httpx
 import psutil
-from cpuinfo import get_cpu_info
 
 from .utils import CpuFreq, readable_python_version, system_name
 
@@ -17,10 +16,14 @@ def _dt_now() -> datetime:
     return datetime.now(timezone.utc).astimezone()
 
 
-BOOT_TIME = datetime.fromtimestamp(psutil.boot_time(), tz=timezone.utc).astimezone()
 ASTRBOT_START_TIME = _dt_now()
 
 
+@lru_cache(maxsize=None)
+def boot_time() -> datetime:
+    return datetime.fromtimestamp(psutil.boot_time(), tz=timezone.utc).astimezone()
+
+
 def _format_td(dt: timedelta) -> str:
     days = dt.days
     rest = dt - timedelta(days=days)
@@ -33,9 +36,18 @@ def _format_td(dt: timedelta) -> str:
     return " ".join(parts)
 
 
+@lru_cache(maxsize=None)
+def _probe_cpu_brand() -> str:
+    # cpuinfo 导入较慢且 get_cpu_info() 会探测硬件，耗时可达数百毫秒，故延迟导入并缓存结果；
+    # 探测失败时抛出异常，lru_cache 不会缓存，下次调用会重试
+    from cpuinfo import get_cpu_info
+
+    return str(get_cpu_info().get("brand_raw") or "")
+
+
 def get_cpu_brand() -> str:
     try:
-        brand = str(get_cpu_info().get("brand_raw") or "")
+        brand = _probe_cpu_brand()
     except Exception:
         return "Unknown CPU"
     brand = brand.strip()
@@ -118,14 +130,18 @@ class DiskIO:
     write: float
 
 
-_last_disk_io = (time.time(), psutil.disk_io_counters(perdisk=True))
+# 上一次采样的 (时间, 计数器)；首次调用 disk_io()/warmup() 时才建立基线，避免导入时产生副作用
+_last_disk_io: tuple[float, dict[str, Any]] | None = None
 
 
 def disk_io() -> list[DiskIO]:
     global _last_disk_io
     now = time.time()
-    past_t, past = _last_disk_io
     now_c = psutil.disk_io_counters(perdisk=True)
+    if _last_disk_io is None:
+        _last_disk_io = (now, now_c)
+        return []
+    past_t, past = _last_disk_io
     dt = max(1e-6, now - past_t)
     ret: list[DiskIO] = []
     for name, now_one in now_c.items():
@@ -148,15 +164,18 @@ class NetIO:
     recv: float
 
 
-_last_net_io = (time.time(), psutil.net_io_counters(pernic=True))
+_last_net_io: tuple[float, dict[str, Any]] | None = None
 
 
 def network_io(ignore_names: list[str] | None = None) -> list[NetIO]:
     global _last_net_io
     ignore_names = ignore_names or []
     now = time.time()
-    past_t, past = _last_net_io
     now_c = psutil.net_io_counters(pernic=True)
+    if _last_net_io is None:
+        _last_net_io = (now, now_c)
+        return []
+    past_t, past = _last_net_io
     dt = max(1e-6, now - past_t)
     ret: list[NetIO] = []
     for name, now_one in now_c.items():
@@ -183,6 +202,8 @@ class ConnTest:
 
 
 async def connection_test() -> list[ConnTest]:
+    import httpx
+
     sites = [
         ("百度", "https://www.baidu.com/"),
         ("Google", "https://www.google.com/"),
@@ -237,6 +258,19 @@ def process_status(n: int = 5) -> list[ProcStatus]:
     return procs[:n]
 
 
+def warmup() -> None:
+    """预热采集器：建立 IO 速率基线并填充较慢的缓存项。
+
+    会阻塞（cpuinfo 探测），应放到线程中执行。
+    """
+    # 先建立速率基线，缩短首次请求时磁盘 / 网络为空的窗口；再执行较慢的 cpuinfo 探测
+    cpu_percent()
+    disk_io()
+    network_io()
+    boot_time()
+    get_cpu_brand()
+
+
 async def collect_all() -> dict[str, Any]:
     # 采集系统及运行状态信息，供前端模板使用
     return {
@@ -258,5 +292,5 @@ async def collect_all() -> dict[str, Any]:
         "system_name": system_name(),
         # header：AstrBot / 机器人运行时长
         "bot_run_time": _format_td(_dt_now() - ASTRBOT_START_TIME),
-        "system_run_time": _format_td(_dt_now() - BOOT_TIME),
+        "system_run_time": _format_td(_dt_now() - boot_time()),
     }
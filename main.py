@@ -1,22 +1,21 @@
 from __future__ import annotations
+import asyncio
 import os
 from pathlib import Path
 from typing import Final
 
 import astrbot.api.message_components as Comp
-import httpx
 from astrbot.api import logger
 from astrbot.api.event import AstrMessageEvent, filter
 from astrbot.api.star import Context, Star, register
 
 from .bg_provider import resolve_background
 from .collectors import collect_all
-from .utils import ensure_dir
+from .output_profile import OutputRenderer, RenderResult
 
 
 PLUGIN_NAME: Final[str] = "astrbot_plugin_picstatus"
 ALIASES: Final[set[str]] = {"状态", "zt", "yxzt", "status", "运行状态"}
-CACHE_DIR = Path(__file__).parent / ".cache"
 
 
 @register(
@@ -28,17 +27,37 @@ CACHE_DIR = Path(__file__).parent / ".cache"
 class PicStatusPlugin(Star):
     def __init__(self, context: Context, config=None):
         super().__init__(context)
-        ensure_dir(CACHE_DIR)
         self.config = config
+        self._warmup_task: asyncio.Task | None = None
+        self.output_renderer = OutputRenderer()
 
     async def initialize(self):
+        # 预热放到后台执行，不阻塞 AstrBot 启动 / 插件热重载
+        self._warmup_task = asyncio.create_task(self._warmup())
         logger.info("PicStatus plugin initialized")
 
+    async def _warmup(self):
+        from . import collectors, t2i_renderer
+
+        # 各步骤独立处理异常，避免某一步失败导致后续预热被跳过
+        for name, step in (
+            ("collectors", collectors.warmup),
+            ("t2i_renderer", t2i_renderer.warmup),
+        ):
+            try:
+                await asyncio.to_thread(step)
+            except Exception as e:
+                logger.warning(f"PicStatus: {name} warmup failed, reason: {e}")
+        logger.debug("PicStatus: warmup finished")
+
     @filter.command("运行状态", alias=ALIASES)
     async def cmd_status(self, event: AstrMessageEvent):
         """生成并发送当前服务器运行状态图片"""
+        import httpx
+
         # t2i_error 用於標記 AstrBot t2i 渲染階段的錯誤，使外層錯誤處理可以給出更精準提示。
         t2i_error: Exception | None = None
+        rendered: RenderResult | None = None
         try:
             collected = await collect_all()
             collected.setdefault("ps_version", "v1.0.0")
@@ -122,10 +141,21 @@ class PicStatusPlugin(Star):
                 html = build_default_html(
                     collected, resolved.data, resolved.mime, avatar_bytes=avatar_bytes
                 )
-                # 未增强 t2i：整页截图；页面背景由模板负责铺满
-                options = {"type": "jpeg", "quality": 90, "full_page": True}
-                out_url = await self.html_render(html, {}, return_url=True, options=options)
-                image_to_send = out_url
+                # 页面背景由模板负责铺满；需要统计体积的配置会渲染为本地文件
+                async def render(options: dict, return_url: bool) -> str:
+                    return await self.html_render(
+                        html, {}, return_url=return_url, options=options
+                    )
+
+                profile, budget_kb, max_attempts = self._output_settings()
+                result = await self.output_renderer.render(
+                    render,
+                    profile=profile,
+                    budget_bytes=budget_kb * 1024,
+                    max_attempts=max_attempts,
+                )
+                image_to_send = result.path
+                rendered = result
                 logger.info("PicStatus: AstrBot t2i renderer used")
             except Exception as e:
                 t2i_error = e
@@ -138,7 +168,30 @@ class PicStatusPlugin(Star):
             yield event.plain_result(msg)
             return
 
-        yield event.image_result(image_to_send)
+        try:
+            yield event.image_result(image_to_send)
+        finally:
+            # 本地渲染的截图在发送完成后删除，避免在 t2i 临时目录中堆积
+            if rendered is not None:
+                rendered.cleanup()
+
+    def _output_settings(self) -> tuple[str, int, int]:
+        """读取输出配置：(output_profile, size_budget_kb, budget_max_attempts)。"""
+        cfg = getattr(self, "config", None)
+        if not hasattr(cfg, "get"):
+            return "default", 0, 3
+        profile = str(cfg.get("output_profile") or "default").strip() or "default"
+        try:
+            budget_kb = max(0, int(cfg.get("size_budget_kb") or 0))
+        except (TypeError, ValueError):
+            budget_kb = 0
+        try:
+            max_attempts = max(1, int(cfg.get("budget_max_attempts") or 3))
+        except (TypeError, ValueError):
+            max_attempts = 3
+        return profile, budget_kb, max_attempts
 
     async def terminate(self):
+        if self._warmup_task and not self._warmup_task.done():
+            self._warmup_task.cancel()
         logger.info("PicStatus plugin terminated")
@@ -0,0 +1,283 @@
+from __future__ import annotations
+
+import contextlib
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Optional
+
+try:
+    from astrbot.api import logger  # type: ignore
+except Exception:  # pragma: no cover - fallback for local test env
+    import logging
+
+    logger = logging.getLogger("astrbot_plugin_picstatus")
+
+
+# 模板页面宽度固定为 650px（见 t2i_renderer 中的 page_fix）
+PAGE_WIDTH = 650
+# clip 高度上限；Playwright 会把 clip 裁剪到整页尺寸，所以实际高度等于页面高度
+CLIP_MAX_HEIGHT = 10000
+# 预算模式下依次尝试的 (格式, 质量)，从清晰到体积小
+BUDGET_LADDER: tuple[tuple[str, Optional[int]], ...] = (
+    ("png", None),
+    ("jpeg", 85),
+    ("jpeg", 75),
+    ("jpeg", 65),
+    ("jpeg", 55),
+    ("jpeg", 45),
+    ("jpeg", 35),
+)
+# 从 JPEG 85 开始；PNG 与 JPEG 体积差距很大，不能由 JPEG 体积推算，
+# 只在 JPEG 85 明显低于预算时额外试渲染一次 PNG，按实测体积决定是否使用
+BUDGET_START_INDEX = 1
+# 实际大小低于预算的该比例时，下次从更高一档质量开始尝试
+BUDGET_UPGRADE_RATIO = 0.6
+
+# (options, return_url) -> 图片 URL 或本地文件路径
+RenderFunc = Callable[[dict[str, Any], bool], Awaitable[str]]
+
+
+@dataclass
+class OutputProfile:
+    name: str
+    type: str = "jpeg"
+    quality: Optional[int] = 90
+    # True 时使用固定 650px 宽度的 clip，不再依赖整页测量出的宽度
+    clip: bool = False
+    # "css" 时按 CSS 像素截图，高 DPI 渲染端不会输出 2x/3x 的大图
+    scale: Optional[str] = None
+    # True 时渲染为本地文件以统计体积；False 时直接使用 t2i 返回的 URL，不统计体积
+    local: bool = True
+
+    def to_options(self) -> dict[str, Any]:
+        options: dict[str, Any] = {"type": self.type, "full_page": True}
+        if self.type == "jpeg" and self.quality is not None:
+            options["quality"] = self.quality
+        if self.clip:
+            # 与 full_page 同时使用时，clip 会被裁剪到整页范围内
+            options["clip"] = {
+                "x": 0,
+                "y": 0,
+                "width": PAGE_WIDTH,
+                "height": CLIP_MAX_HEIGHT,
+            }
+        if self.scale:
+            options["scale"] = self.scale
+        return options
+
+
+PROFILES: dict[str, OutputProfile] = {
+    # 与旧版本一致：整页 JPEG 90，直接发送 t2i URL
+    "default": OutputProfile("default", local=False),
+    "balanced": OutputProfile("balanced", quality=75, clip=True, scale="css"),
+    "small": OutputProfile("small", quality=55, clip=True, scale="css"),
+    "png": OutputProfile("png", type="png", quality=None, clip=True, scale="css"),
+}
+BUDGET_PROFILE = "budget"
+
+
+@dataclass
+class ProfileStats:
+    count: int = 0
+    # 统计了体积的渲染次数（URL 模式不统计体积）
+    sized_count: int = 0
+    last_bytes: Optional[int] = None
+    last_ms: float = 0.0
+    total_bytes: int = 0
+    total_ms: float = 0.0
+    # 预算模式：下次开始尝试的档位（BUDGET_LADDER 下标）
+    ladder_index: int = BUDGET_START_INDEX
+    # 预算模式：曾超出预算的最高档位（最小下标），之后不再升回该档位及以上
+    over_index: Optional[int] = None
+    # 预算模式：最近一次实测的 PNG 体积
+    png_bytes: Optional[int] = None
+    over_budget: int = 0
+
+    @property
+    def avg_bytes(self) -> float:
+        return self.total_bytes / self.sized_count if self.sized_count else 0.0
+
+    @property
+    def avg_ms(self) -> float:
+        return self.total_ms / self.count if self.count else 0.0
+
+    def record(self, size: Optional[int], ms: float) -> None:
+        self.count += 1
+        self.last_bytes = size
+        self.last_ms = ms
+        self.total_ms += ms
+        if size is not None:
+            self.sized_count += 1
+            self.total_bytes += size
+
+
+@dataclass
+class RenderResult:
+    path: str
+    # 直接使用 URL 时为 None
+    size: Optional[int]
+    ms: float
+    options: dict[str, Any]
+    attempts: int = 1
+
+    def cleanup(self) -> None:
+        """删除渲染出的本地文件；URL 结果无需处理。"""
+        if self.size is not None:
+            _remove_file(self.path)
+
+
+def _remove_file(path: str) -> None:
+    with contextlib.suppress(OSError):
+        os.remove(path)
+
+
+class OutputRenderer:
+    """按输出配置渲染状态图，并按配置记录每次渲染的体积与耗时。"""
+
+    def __init__(self) -> None:
+        self.stats: dict[str, ProfileStats] = {}
+
+    def get_stats(self, name: str) -> ProfileStats:
+        return self.stats.setdefault(name, ProfileStats())
+
+    async def _render_url(
+        self, render: RenderFunc, options: dict[str, Any],
+    ) -> tuple[str, float]:
+        start = time.perf_counter()
+        url = await render(options, True)
+        return url, (time.perf_counter() - start) * 1000
+
+    async def _render_local(
+        self, render: RenderFunc, options: dict[str, Any],
+    ) -> tuple[str, int, float]:
+        start = time.perf_counter()
+        path = await render(options, False)
+        ms = (time.perf_counter() - start) * 1000
+        return path, os.path.getsize(path), ms
+
+    async def render(
+        self,
+        render: RenderFunc,
+        profile: str = "default",
+        budget_bytes: int = 0,
+        max_attempts: int = 3,
+    ) -> RenderResult:
+        if profile == BUDGET_PROFILE and budget_bytes <= 0:
+            logger.warning(
+                "PicStatus: output_profile=budget requires size_budget_kb > 0, "
+                "using default profile",
+            )
+            profile = "default"
+
+        if profile == BUDGET_PROFILE:
+            result = await self._render_budget(render, budget_bytes, max_attempts)
+        else:
+            prof = PROFILES.get(profile)
+            if prof is None:
+                logger.warning(f"PicStatus: unknown output profile {profile!r}, using default")
+                profile, prof = "default", PROFILES["default"]
+            options = prof.to_options()
+            if prof.local:
+                path, size, ms = await self._render_local(render, options)
+                result = RenderResult(path=path, size=size, ms=ms, options=options)
+            else:
+                url, ms = await self._render_url(render, options)
+                result = RenderResult(path=url, size=None, ms=ms, options=options)
+
+        stats = self.get_stats(profile)
+        stats.record(result.size, result.ms)
+        size_text = "n/a" if result.size is None else f"{result.size / 1024:.1f}KB"
+        logger.info(
+            f"PicStatus: profile={profile} size={size_text} "
+            f"render={result.ms:.0f}ms attempts={result.attempts} "
+            f"(avg {stats.avg_bytes / 1024:.1f}KB / {stats.avg_ms:.0f}ms over {stats.count})",
+        )
+        return result
+
+    def _png_fits(self, budget_bytes: int) -> bool:
+        """是否有实测 PNG 体积（预算模式或 png 配置）表明 PNG 不会超出预算。"""
+        sizes = [self.get_stats(BUDGET_PROFILE).png_bytes]
+        if "png" in self.stats:
+            sizes.append(self.stats["png"].last_bytes)
+        known = [s for s in sizes if s is not None]
+        return bool(known) and max(known) <= budget_bytes
+
+    @staticmethod
+    def _budget_options(idx: int) -> dict[str, Any]:
+        fmt, quality = BUDGET_LADDER[idx]
+        return OutputProfile(
+            BUDGET_PROFILE, type=fmt, quality=quality, clip=True, scale="css",
+        ).to_options()
+
+    async def _render_budget(
+        self, render: RenderFunc, budget_bytes: int, max_attempts: int,
+    ) -> RenderResult:
+        stats = self.get_stats(BUDGET_PROFILE)
+        max_attempts = max(1, max_attempts)
+        last = len(BUDGET_LADDER) - 1
+        idx = min(stats.ladder_index, last)
+        attempts = 0
+        total_ms = 0.0
+        while True:
+            attempts += 1
+            options = self._budget_options(idx)
+            path, size, ms = await self._render_local(render, options)
+            total_ms += ms
+            if idx == 0:
+                stats.png_bytes = size
+            if size > budget_bytes and (stats.over_index is None or idx < stats.over_index):
+                stats.over_index = idx
+            if size <= budget_bytes or idx == last or attempts >= max_attempts:
+                break
+            # 丢弃超出预算的渲染结果，避免临时文件堆积
+            _remove_file(path)
+            if idx == 0:
+                # PNG 的体积不能用来推算 JPEG，下一次从最高 JPEG 质量开始
+                idx = BUDGET_START_INDEX
+            else:
+                # 按超出比例估算需要下调的档位数，减少重复渲染次数
+                steps = max(1, int(size / budget_bytes))
+                idx = min(idx + steps, last)
+
+        if (
+            idx == BUDGET_START_INDEX
+            and size < budget_bytes * BUDGET_UPGRADE_RATIO
+            and stats.png_bytes is None
+            and stats.over_index is None
+            and attempts < max_attempts
+        ):
+            # JPEG 85 明显低于预算且从未测过 PNG：试渲染一次 PNG，取不超预算的结果
+            attempts += 1
+            png_options = self._budget_options(0)
+            png_path, png_size, ms = await self._render_local(render, png_options)
+            total_ms += ms
+            stats.png_bytes = png_size
+            if png_size <= budget_bytes:
+                _remove_file(path)
+                idx, path, size, options = 0, png_path, png_size, png_options
+            else:
+                stats.over_index = 0
+                _remove_file(png_path)
+
+        fmt, quality = BUDGET_LADDER[idx]
+        if size > budget_bytes:
+            stats.over_budget += 1
+            logger.warning(
+                f"PicStatus: image {size / 1024:.1f}KB exceeds budget "
+                f"{budget_bytes / 1024:.0f}KB at {fmt} quality {quality}",
+            )
+            # 下次直接从更低一档开始
+            stats.ladder_index = min(idx + 1, last)
+        elif size < budget_bytes * BUDGET_UPGRADE_RATIO and idx > 0:
+            up = idx - 1
+            # 不升回曾超出预算的档位；升到 PNG 需要有实测 PNG 体积支持
+            blocked = stats.over_index is not None and up <= stats.over_index
+            if up < BUDGET_START_INDEX and not self._png_fits(budget_bytes):
+                blocked = True
+            stats.ladder_index = idx if blocked else up
+        else:
+            stats.ladder_index = idx
+        return RenderResult(
+            path=path, size=size, ms=total_ms, options=options, attempts=attempts,
+        )
@@ -0,0 +1,122 @@
+"""插件导入耗时基准，防止启动 / 热重载性能回退。
+
+用法（在插件目录下执行）::
+
+    python scripts/bench_startup.py [--runs 5] [--max-ms 300]
+
+每轮在全新的解释器中导入插件模块，统计耗时，并检查：
+- 导入后未加载 cpuinfo / jinja2 / httpx 等重依赖；
+- 导入过程中未创建 .cache 等目录。
+安装了 astrbot 时另外导入 main 并单独计时，重依赖检查只统计 main 自身新引入的模块。
+--max-ms 只约束不依赖 astrbot 的模块耗时，便于在不同环境间比较；
+超出预算或检查失败时以非零状态码退出。
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+
+PLUGIN_DIR = Path(__file__).resolve().parent.parent
+HEAVY_MODULES = ("cpuinfo", "jinja2", "markupsafe", "httpx")
+ASTRBOT_MODULES = (
+    "astrbot.api",
+    "astrbot.api.event",
+    "astrbot.api.star",
+    "astrbot.api.message_components",
+)
+
+_PROBE = r"""
+import importlib, importlib.util, json, sys, time
+sys.path.insert(0, {parent!r})
+pkg = {pkg!r}
+heavy_names = {heavy!r}
+mods = ["collectors", "bg_provider", "t2i_renderer"]
+start = time.perf_counter()
+for m in mods:
+    importlib.import_module(f"{{pkg}}.{{m}}")
+plugin_ms = (time.perf_counter() - start) * 1000
+heavy = [m for m in heavy_names if m in sys.modules]
+
+main_ms = None
+if importlib.util.find_spec("astrbot") is not None:
+    # 先导入 main 用到的 astrbot 接口，astrbot 自身引入的依赖不计入插件
+    for m in {astrbot_mods!r}:
+        importlib.import_module(m)
+    before = set(sys.modules)
+    start = time.perf_counter()
+    importlib.import_module(f"{{pkg}}.main")
+    main_ms = (time.perf_counter() - start) * 1000
+    heavy += [m for m in heavy_names if m in sys.modules and m not in before]
+
+print(json.dumps({{"plugin_ms": plugin_ms, "main_ms": main_ms, "heavy": heavy}}))
+"""
+
+
+def run_once() -> dict:
+    code = _PROBE.format(
+        parent=str(PLUGIN_DIR.parent),
+        pkg=PLUGIN_DIR.name,
+        heavy=HEAVY_MODULES,
+        astrbot_mods=ASTRBOT_MODULES,
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+    )
+    if out.returncode != 0:
+        raise SystemExit(f"import failed:\n{out.stderr}")
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def _report(label: str, times: list[float]) -> float:
+    median = statistics.median(times)
+    print(
+        f"{label}: median {median:.1f} ms, "
+        f"min {min(times):.1f} ms, max {max(times):.1f} ms ({len(times)} runs)"
+    )
+    return median
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--max-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    cache_dir = PLUGIN_DIR / ".cache"
+    cache_existed = cache_dir.exists()
+
+    results = [run_once() for _ in range(args.runs)]
+    plugin_median = _report(
+        "collectors/bg_provider/t2i_renderer", [r["plugin_ms"] for r in results],
+    )
+    main_times = [r["main_ms"] for r in results if r["main_ms"] is not None]
+    if main_times:
+        _report("main (astrbot preloaded)", main_times)
+    else:
+        print("main: skipped (astrbot not installed)")
+
+    failed = False
+    heavy = sorted({m for r in results for m in r["heavy"]})
+    if heavy:
+        print(f"FAIL: heavy modules loaded at import time: {', '.join(heavy)}")
+        failed = True
+    if not cache_existed and cache_dir.exists():
+        print(f"FAIL: import created {cache_dir}")
+        failed = True
+    if args.max_ms is not None and plugin_median > args.max_ms:
+        print(
+            f"FAIL: median {plugin_median:.1f} ms exceeds budget {args.max_ms:.1f} ms"
+        )
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
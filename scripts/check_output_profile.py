@@ -0,0 +1,139 @@
+"""输出配置 / 体积预算模式的行为检查，使用假的渲染函数，无需 AstrBot 与 t2i 服务。
+
+用法（在插件目录下执行）::
+
+    python scripts/check_output_profile.py
+
+检查预算模式的档位能稳定下来、超出预算的中间文件被删除、max_attempts 生效、
+PNG 只在实测不超预算时使用、size_budget_kb=0 回退到 default 等。
+任一检查失败时以非零状态码退出。
+"""
+from __future__ import annotations
+
+import asyncio
+import importlib
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any
+
+
+PLUGIN_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PLUGIN_DIR.parent))
+op = importlib.import_module(f"{PLUGIN_DIR.name}.output_profile")
+
+KB = 1024
+
+
+class FakeRender:
+    """按 (格式, 质量) 返回固定体积的假渲染，记录每次调用并跟踪生成的文件。"""
+
+    def __init__(self, tmp_dir: str, sizes: dict[str, int]) -> None:
+        self.tmp_dir = tmp_dir
+        self.sizes = sizes
+        self.calls: list[str] = []
+        self.files: list[str] = []
+
+    async def __call__(self, options: dict[str, Any], return_url: bool) -> str:
+        key = "png" if options["type"] == "png" else str(options.get("quality"))
+        if return_url:
+            self.calls.append(f"url:{key}")
+            return "https://t2i.example/out.jpeg"
+        self.calls.append(key)
+        fd, path = tempfile.mkstemp(dir=self.tmp_dir)
+        with os.fdopen(fd, "wb") as f:
+            f.write(b"\0" * self.sizes[key])
+        self.files.append(path)
+        return path
+
+    def live_files(self) -> list[str]:
+        return [p for p in self.files if os.path.exists(p)]
+
+
+async def run_requests(
+    sizes: dict[str, int],
+    n: int,
+    profile: str = op.BUDGET_PROFILE,
+    budget_kb: int = 300,
+    max_attempts: int = 3,
+) -> tuple[op.OutputRenderer, list[list[str]], list[op.RenderResult], FakeRender]:
+    tmp_dir = tempfile.mkdtemp(prefix="picstatus-check-")
+    fake = FakeRender(tmp_dir, sizes)
+    renderer = op.OutputRenderer()
+    per_request: list[list[str]] = []
+    results: list[op.RenderResult] = []
+    for _ in range(n):
+        start = len(fake.calls)
+        result = await renderer.render(
+            fake, profile=profile, budget_bytes=budget_kb * KB, max_attempts=max_attempts,
+        )
+        per_request.append(fake.calls[start:])
+        results.append(result)
+        # 只有最终结果会留在磁盘上，发送后由调用方清理
+        if fake.live_files() != ([result.path] if result.size is not None else []):
+            raise AssertionError(f"unexpected files left on disk: {fake.live_files()}")
+        result.cleanup()
+    os.rmdir(tmp_dir)
+    return renderer, per_request, results, fake
+
+
+failures: list[str] = []
+
+
+def check(cond: bool, msg: str) -> None:
+    print(f"{'ok  ' if cond else 'FAIL'} {msg}")
+    if not cond:
+        failures.append(msg)
+
+
+async def main() -> int:
+    jpeg = {"85": 100 * KB, "75": 80 * KB, "65": 60 * KB, "55": 50 * KB, "45": 40 * KB, "35": 30 * KB}
+
+    # PNG 远超预算：最多试一次 PNG，之后稳定在 JPEG 85，每次只渲染一次
+    _, calls, results, fake = await run_requests({"png": 800 * KB, **jpeg}, 8)
+    check(calls[0] == ["85", "png"], f"PNG probed once after JPEG 85 fits: {calls[0]}")
+    check(all(c == ["85"] for c in calls[1:]), f"settles on JPEG 85 without alternating: {calls}")
+    check(all(r.options["type"] == "jpeg" for r in results), "over-budget PNG is never sent")
+    check(not fake.live_files(), "no files left after cleanup")
+
+    # PNG 不超预算：试渲染后选择 PNG，并保持使用
+    _, calls, results, _ = await run_requests({"png": 250 * KB, **jpeg}, 4)
+    check(results[0].options["type"] == "png", "PNG chosen when its measured size fits")
+    check(all(c == ["png"] for c in calls[1:]), f"stays on PNG: {calls}")
+
+    # JPEG 85 超出预算：逐档下调，之后稳定，不再升回超出预算的档位
+    sizes = {"png": 900 * KB, "85": 700 * KB, "75": 500 * KB, "65": 400 * KB,
+             "55": 290 * KB, "45": 160 * KB, "35": 120 * KB}
+    renderer, calls, results, _ = await run_requests(sizes, 6)
+    check(calls[0] == ["85", "65", "55"], f"steps down until under budget: {calls[0]}")
+    check(all(c == ["55"] for c in calls[1:]), f"settles on JPEG 55: {calls}")
+    check(all(r.size <= 300 * KB for r in results), "results fit the budget")
+    check(renderer.get_stats(op.BUDGET_PROFILE).over_index == 1, "over-budget level is recorded")
+
+    # max_attempts：超出次数后发送当前结果
+    _, calls, results, _ = await run_requests(sizes, 1, max_attempts=2)
+    check(calls[0] == ["85", "65"], f"max_attempts=2 renders twice: {calls[0]}")
+    check(results[0].attempts == 2, "attempts are reported")
+    _, calls, _, _ = await run_requests({"png": 800 * KB, **jpeg}, 1, max_attempts=1)
+    check(calls[0] == ["85"], f"max_attempts=1 skips the PNG probe: {calls[0]}")
+
+    # size_budget_kb=0：回退到 default，直接使用 URL，统计记在 default 下
+    renderer, calls, results, _ = await run_requests({}, 1, budget_kb=0)
+    check(calls[0] == ["url:90"], f"budget 0 falls back to default URL render: {calls[0]}")
+    check(results[0].size is None, "default profile does not measure size")
+    check(
+        "default" in renderer.stats and op.BUDGET_PROFILE not in renderer.stats,
+        "stats recorded under default",
+    )
+
+    # 普通配置：本地渲染并统计体积
+    renderer, calls, results, _ = await run_requests(jpeg, 1, profile="balanced")
+    check(calls[0] == ["75"] and results[0].size == 80 * KB, "balanced renders JPEG 75 locally")
+
+    print(f"{len(failures)} failure(s)")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
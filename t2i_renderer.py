@@ -4,9 +4,6 @@ import base64
 from pathlib import Path
 from typing import Any, Optional
 
-import jinja2
-from markupsafe import Markup
-
 
 ROOT = Path(__file__).parent
 TPL_DIR = ROOT / "templates" / "default" / "res" / "templates"
@@ -30,6 +27,9 @@ def build_default_html(
     - Replace background to inline data URL
     - Inline CSS via <style>
     """
+    # jinja2 在首次渲染时才导入，缩短插件加载/热重载耗时
+    import jinja2
+    from markupsafe import Markup
 
     macros = _read_text(TPL_DIR / "macros.html.jinja")
     index = _read_text(TPL_DIR / "index.html.jinja")
@@ -168,3 +168,9 @@ def build_default_html(
     }
     html = template.render(d=collected, config=config)
     return html
+
+
+def warmup() -> None:
+    """提前导入 jinja2，使首次渲染不再承担导入开销。"""
+    import jinja2  # noqa: F401
+    import markupsafe  # noqa: F401
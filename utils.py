@@ -4,7 +4,6 @@ import platform
 import sys
 import time
 from dataclasses import dataclass
-from pathlib import Path
 
 
 @dataclass
@@ -14,11 +13,6 @@ class CpuFreq:
     max: float | None
 
 
-def ensure_dir(path: Path) -> Path:
-    path.mkdir(parents=True, exist_ok=True)
-    return path
-
-
 def now_ts() -> int:
     return int(time.time())
 